@@ -48,7 +48,7 @@ class AttemptFailBox(Gtk.Box):
         super().__init__(**kwargs)
 
         # TRANSLATORS: {} represents the attempt number.
-        self.attempt_label.set_label(_("Attempt {}").format(str(attempt_no)))
+        self.attempt_label.set_label(_("Attempt {}").format(attempt_no))
 
         # TRANSLATORS: this is an abbreviation of 'High Quality'
         hq_label = _('HQ')
@@ -24,6 +24,7 @@ import subprocess
 import os
 import argparse
 import re
+import json
 from pathlib import Path
 from tempfile import TemporaryFile
 from typing import List, Optional, Tuple, Callable
@@ -467,6 +468,34 @@ def get_resolution(file_input: str) -> Tuple[int, int]:
     return (width, height)
 
 
+def get_video_metadata(file_input: str) -> Tuple[int, int, float, float]:
+    """ Gets the width, height, framerate and duration (in seconds) of a video
+    at the passed file path, using a single ffprobe call.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=width,height,avg_frame_rate:format=duration',
+        '-of', 'json',
+        file_input
+    ]
+
+    metadata_bytes = subprocess.check_output(cmd)
+    metadata = json.loads(metadata_bytes)
+
+    stream = metadata['streams'][0]
+    width = int(stream['width'])
+    height = int(stream['height'])
+
+    fps_numerator, fps_denominator = stream['avg_frame_rate'].split('/')
+    fps = int(fps_numerator) / int(fps_denominator)
+
+    duration = float(metadata['format']['duration'])
+
+    return (width, height, fps, duration)
+
+
 def get_rotation(file_input: str) -> int:
     """ Gets the rotation value of a video at the passed file path. """
     cmd = [
@@ -682,9 +711,9 @@ def compress(
         return _("Constrict: File already meets the target size.")
 
     try:
-        duration_seconds = get_duration(file_input)
-        source_fps = get_framerate(file_input)
-        width, height = get_resolution(file_input)
+        width, height, source_fps, duration_seconds = get_video_metadata(
+            file_input
+        )
         source_frame_count = get_frame_count(file_input)
         rotation = get_rotation(file_input)
     except subprocess.CalledProcessError:
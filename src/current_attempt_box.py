@@ -23,6 +23,14 @@ from constrict import PREFIX
 from gettext import ngettext
 from typing import Any
 
+# TRANSLATORS: {} represents the attempt number.
+ATTEMPT_1_LABEL = _('Attempt {}').format('1')
+
+# Every whole percentage the progress details label can show, with a U+202F
+# Narrow no-break space between the value and '%'.
+PERCENT_LABELS = tuple(f'{i} %' for i in range(101))
+
+
 @Gtk.Template(resource_path=f'{PREFIX}/current_attempt_box.ui')
 class CurrentAttemptBox(Gtk.Box):
     """ A box showing the details of a currently running compression, shown in
@@ -38,16 +46,44 @@ class CurrentAttemptBox(Gtk.Box):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-        # TRANSLATORS: {} represents the attempt number.
-        self.attempt_label.set_label(_('Attempt {}').format('1'))
+        self._last_fraction_q = -1
+
+        # Reused between progress updates to format the progress text.
+        self._progress_fields = {}
+
+        # The text last set above the progress bar.
+        self._progress_text = None
+
+        self.attempt_label.set_label(ATTEMPT_1_LABEL)
 
     def set_progress_text(self, label: str, daemon: bool) -> None:
-        """ Sets the text above the progress bar to the string passed """
-        update_ui(self.progress_details_label.set_text, label, daemon)
+        """ Sets the text above the progress bar to the string passed. Setting
+        the text already shown does nothing.
+        """
+        update_ui(self.show_progress_text, label, daemon=daemon)
+
+    def show_progress_text(self, label: str) -> None:
+        """ Show the passed text above the progress bar, if it isn't shown
+        already. Must run on the main thread.
+        """
+        if label == self._progress_text:
+            return
+
+        self._progress_text = label
+        self.progress_details_label.set_text(label)
 
     def pulse_progress(self, daemon: bool) -> None:
         """ Pulse the progress bar in activity mode """
-        update_ui(self.progress_bar.pulse, None, False)
+        update_ui(self.pulse_if_mapped, daemon=daemon)
+
+    def pulse_if_mapped(self) -> None:
+        """ Pulse the progress bar, unless it isn't shown (i.e. when the
+        popover is closed). Must run on the main thread.
+        """
+        self._last_fraction_q = -1
+
+        if self.progress_bar.get_mapped():
+            self.progress_bar.pulse()
 
     def set_attempt_details(
         self,
@@ -63,8 +99,12 @@ class CurrentAttemptBox(Gtk.Box):
         """
 
         # TRANSLATORS: {} represents the attempt number.
-        attempt_no_label = _('Attempt {}').format(str(attempt_no))
-        update_ui(self.attempt_label.set_label, attempt_no_label, daemon)
+        attempt_no_label = _('Attempt {}').format(attempt_no)
+        update_ui(
+            self.attempt_label.set_label,
+            attempt_no_label,
+            daemon=daemon
+        )
 
         # TRANSLATORS: this is an abbreviation of 'High Quality'
         hq_label = _('HQ')
@@ -87,7 +127,7 @@ class CurrentAttemptBox(Gtk.Box):
         update_ui(
             self.target_details_label.set_label,
             target_details_label,
-            daemon
+            daemon=daemon
         )
 
     def set_progress(
@@ -97,7 +137,17 @@ class CurrentAttemptBox(Gtk.Box):
         daemon: bool
     ) -> None:
         """ Set details of current progress and estimated time left """
-        update_ui(self.progress_bar.set_fraction, fraction, daemon)
+        update_ui(self.show_progress, fraction, seconds_left, daemon=daemon)
+
+    def show_progress(self, fraction: float, seconds_left: int) -> None:
+        """ Show progress details in the box. Must run on the main thread. """
+        # Only update the progress bar when the change would be visible, i.e.
+        # when it moves by at least a pixel.
+        fraction_q = int(fraction * max(self.progress_bar.get_width(), 1))
+
+        if fraction_q != self._last_fraction_q:
+            self.progress_bar.set_fraction(fraction)
+            self._last_fraction_q = fraction_q
 
         progress_percent = int(round(fraction * 100, 0))
         progress_text = ''
@@ -146,6 +196,8 @@ class CurrentAttemptBox(Gtk.Box):
                 # '10% -- About 2 hours, 30 minutes left'
                 time_shown = ngettext('{} hour', '{} hours', hours).format(hours)
 
+            self._progress_fields['percent'] = progress_percent
+            self._progress_fields['time_shown'] = time_shown
 
             # TRANSLATORS: {percent} represents the progress percentage value.
             # {time_shown} represents a string showing the estimated time to
@@ -153,11 +205,12 @@ class CurrentAttemptBox(Gtk.Box):
             # Please use U+202F Narrow no-break space (' ') between {percent}
             # and '%'.
             # Please use U+2014 em dash ('—'), if applicable to your language.
-            progress_text = _('{percent} % — About {time_shown} left').format(
-                percent = progress_percent,
-                time_shown = time_shown
+            progress_text = _('{percent} % — About {time_shown} left').format_map(
+                self._progress_fields
             )
         else:
-            progress_text = f'{progress_percent} %'
+            progress_text = PERCENT_LABELS[progress_percent] if (
+                0 <= progress_percent <= 100
+            ) else f'{progress_percent} %'
 
-        update_ui(self.progress_details_label.set_label, progress_text, daemon)
+        self.show_progress_text(progress_text)
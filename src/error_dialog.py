@@ -47,25 +47,35 @@ class ErrorDialog(Adw.Dialog):
             # language.
             _('There was a problem compressing “{}”').format(safe_video_name)
         )
-        buffer = self.text_view.get_buffer()
-        buffer.set_text(error_details)
+
+        self._error_details = error_details
+
+        # Only fill the text view's buffer once it is actually shown, as
+        # error details can be several kilobytes long.
+        self._map_handler_id = self.text_view.connect(
+            'map',
+            self._load_details
+        )
 
         self.install_action('dialog.copy-details', None, self.copy_details)
 
+    def _load_details(self, text_view: Gtk.TextView) -> None:
+        """ Set the text view's contents to the error details """
+        text_view.disconnect(self._map_handler_id)
+
+        buffer = text_view.get_buffer()
+        buffer.set_text(self._error_details)
+
     def copy_details(
         self,
         widget: Gtk.Widget,
         action_name: str,
         parameter: GLib.Variant
     ) -> None:
-        """ Copy the text in the 'details' text box to the clipboard """
-        text_buffer = widget.text_view.get_buffer()
-
-        start, end = text_buffer.get_bounds()
-
-        text_str = text_buffer.get_text(start, end, False)
-
-        widget.get_clipboard().set(text_str)
+        """ Copy the error details shown in the 'details' text box to the
+        clipboard
+        """
+        widget.get_clipboard().set(widget._error_details)
 
         toast = Adw.Toast.new(_("Details copied to clipboard"))
         widget.toast_overlay.add_toast(toast)
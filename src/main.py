@@ -17,6 +17,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
 import logging
 import sys
 import gi
@@ -26,16 +27,38 @@ gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Gio, Adw, GLib
 from .window import ConstrictWindow
-from constrict.preferences_dialog import PreferencesDialog
+from constrict.shared import VIDEO_TASK_POOL
 from constrict import APPLICATION_ID, VERSION
 from typing import List, Sequence, Callable, Any
 
+# Parameter types for application actions, built once and shared.
+VARIANT_TYPE_STRING = GLib.VariantType.new('s')
+VARIANT_TYPE_INT32 = GLib.VariantType.new('i')
+
 # FIXME: occasional segmentation fault on compression completion? No idea what
 # the cause is yet. It's seemingly random.
 
 class ConstrictApplication(Adw.Application):
     """The main application singleton class."""
 
+    # Application actions, as (name, parameter type, callback name, shortcuts)
+    _ACTIONS = (
+        ('new-window', None, 'on_new_window_action', ['<primary>n']),
+        ('quit', None, 'on_quit_action', ['<primary>q']),
+        ('about', None, 'on_about_action', None),
+        ('preferences', None, 'on_preferences_action', ['<primary>comma']),
+        ('open-dir', VARIANT_TYPE_STRING, 'open_dir', None),
+        ('focus-window', VARIANT_TYPE_INT32, 'focus_window', None)
+    )
+
+    # Shortcuts for actions defined by each window
+    _WINDOW_ACCELS = (
+        ('win.toggle-sidebar', ['F9']),
+        ('win.open', ['<Ctrl>o']),
+        ('win.export', ['<Ctrl>e']),
+        ('win.close', ['<Ctrl>w'])
+    )
+
     def __init__(self) -> None:
         super().__init__(application_id=APPLICATION_ID,
                          flags=Gio.ApplicationFlags.HANDLES_OPEN)
@@ -49,36 +72,37 @@ class ConstrictApplication(Adw.Application):
             None
         )
 
-        self.create_action('new-window', lambda *_: self.new_window(), ['<primary>n'])
-        self.create_action('quit', lambda *_: self.quit(), ['<primary>q'])
-        self.create_action('about', self.on_about_action)
-        self.create_action('preferences', self.on_preferences_action, ['<primary>comma'])
-
-        self.open_dir_action = Gio.SimpleAction(
-            name="open-dir",
-            parameter_type=GLib.VariantType.new('s')
-        )
-        self.open_dir_action.connect("activate", self.open_dir)
-        self.add_action(self.open_dir_action)
-
-        self.focus_window_action = Gio.SimpleAction(
-            name="focus-window",
-            parameter_type=GLib.VariantType.new('i')
-        )
-        self.focus_window_action.connect("activate", self.focus_window)
-        self.add_action(self.focus_window_action)
-
-        self.set_accels_for_action('app.new-window', ['<primary>n'])
-        self.set_accels_for_action('win.toggle-sidebar', ['F9'])
-        self.set_accels_for_action('win.open', ['<Ctrl>o'])
-        self.set_accels_for_action('win.export', ['<Ctrl>e'])
-        self.set_accels_for_action('win.close', ['<Ctrl>w'])
-
         self.settings = Gio.Settings(schema_id=self.get_application_id())
 
+        # Built on first use, then presented again on later invocations.
+        self._about_dialog = None
+
+    def do_startup(self) -> None:
+        """ Called when the primary instance of the application starts. Actions
+        are registered here rather than in __init__, so invocations that are
+        forwarded to an already running instance don't create them.
+        """
+        Adw.Application.do_startup(self)
+
+        for name, parameter_type, callback_name, shortcuts in self._ACTIONS:
+            self.create_action(
+                name,
+                getattr(self, callback_name),
+                shortcuts,
+                parameter_type
+            )
+
+        for detailed_action_name, accels in self._WINDOW_ACCELS:
+            self.set_accels_for_action(detailed_action_name, accels)
+
+    @functools.cached_property
+    def default_suffix(self) -> str:
+        """ The suffix added to exported file names when no custom suffix is
+        set. Translated on first use rather than at startup.
+        """
         # TRANSLATORS: used in parentheses for the default suffix of exported
         # files.
-        self.default_suffix = f" ({_('compressed')})"
+        return f" ({_('compressed')})"
 
     def get_settings(self) -> Gio.Settings:
         """ Get the application's settings """
@@ -145,18 +169,45 @@ class ConstrictApplication(Adw.Application):
 
         win.present()
 
+    def do_shutdown(self) -> None:
+        """ Called when the application is shutting down. Drop video tasks
+        (like thumbnails) that haven't started yet, so exiting doesn't wait on
+        them. Tasks already running still finish before the interpreter exits,
+        as the pool's worker threads aren't daemonic.
+        """
+        VIDEO_TASK_POOL.shutdown(wait=False, cancel_futures=True)
+        Adw.Application.do_shutdown(self)
+
     def do_handle_local_options(  # pylint: disable=arguments-differ
         self, options: GLib.VariantDict
     ) -> int:
         """Handle local command line arguments."""
-        self.register()
+        # Only register early if an option needs to act on the primary
+        # instance. Otherwise, GApplication registers as part of its usual
+        # command line handling.
         if options.contains("new-window"):
+            self.register()
             self.activate_action('new-window')
             return 0
         return -1
 
+    def on_new_window_action(self, *args: Any) -> None:
+        """Callback for the app.new-window action."""
+        self.new_window()
+
+    def on_quit_action(self, *args: Any) -> None:
+        """Callback for the app.quit action."""
+        self.quit()
+
     def on_about_action(self, *args: Any) -> None:
         """Callback for the app.about action."""
+        if self._about_dialog is None:
+            self._about_dialog = self.build_about_dialog()
+
+        self._about_dialog.present(self.props.active_window)
+
+    def build_about_dialog(self) -> Adw.AboutDialog:
+        """ Create the application's about dialog """
         about = Adw.AboutDialog(application_name=_('Constrict'),
                                 application_icon=self.get_application_id(),
                                 developer_name='Wartybix',
@@ -181,10 +232,13 @@ class ConstrictApplication(Adw.Application):
         )
         # Translators: Replace "translator-credits" with your name/username, and optionally an email or URL.
         about.set_translator_credits(_('translator-credits'))
-        about.present(self.props.active_window)
+
+        return about
 
     def on_preferences_action(self, widget: Gtk.Widget, _) -> None:
         """Callback for the app.preferences action."""
+        # Imported here, as the dialog is rarely needed at startup.
+        from constrict.preferences_dialog import PreferencesDialog
 
         dialog = PreferencesDialog(self)
         dialog.present(self.props.active_window)
@@ -193,7 +247,8 @@ class ConstrictApplication(Adw.Application):
         self,
         name: str,
         callback: Callable,
-        shortcuts: Sequence[str] | None = None
+        shortcuts: Sequence[str] | None = None,
+        parameter_type: GLib.VariantType | None = None
     ) -> None:
         """Add an application action.
 
@@ -202,8 +257,9 @@ class ConstrictApplication(Adw.Application):
             callback: the function to be called when the action is
               activated
             shortcuts: an optional list of accelerators
+            parameter_type: an optional type for the action's parameter
         """
-        action = Gio.SimpleAction.new(name, None)
+        action = Gio.SimpleAction.new(name, parameter_type)
         action.connect("activate", callback)
         self.add_action(action)
         if shortcuts:
@@ -28,6 +28,9 @@ import cairo
 from math import pi
 from typing import Any
 
+HALF_PI = 0.5 * pi
+TAU = 2.0 * pi
+
 
 class ProgressPie(Gtk.DrawingArea):
     """ A circular progress indicator shown in a sources row to communincate
@@ -39,6 +42,7 @@ class ProgressPie(Gtk.DrawingArea):
         super().__init__(**kwargs)
 
         self.fraction = 0.0
+        self.last_drawn_fraction = 0.0
 
         self.set_valign(Gtk.Align.CENTER)
         self.set_halign(Gtk.Align.CENTER)
@@ -48,8 +52,19 @@ class ProgressPie(Gtk.DrawingArea):
         self.queue_draw()
 
     def set_fraction(self, fraction: float) -> None:
-        """ Update the pie to show a new progress fraction """
+        """ Update the pie to show a new progress fraction. The pie is only
+        redrawn when the change would move its edge by about a pixel, or when
+        it becomes empty or full.
+        """
         self.fraction = fraction
+
+        step = 1.0 / max(1.0, self.get_width() * pi)
+        is_bound = fraction <= 0.0 or fraction >= 1.0
+
+        if not is_bound and abs(fraction - self.last_drawn_fraction) < step:
+            return
+
+        self.last_drawn_fraction = fraction
         self.queue_draw()
 
 
@@ -70,13 +85,11 @@ def draw(
 
     Gdk.cairo_set_source_rgba(ctx, rgba)
 
-    ctx.arc(
-        width / 2,
-        height / 2,
-        width / 2,
-        0.0,
-        2 * pi
-    )
+    centre_x = width * 0.5
+    centre_y = height * 0.5
+    radius = centre_x
+
+    ctx.arc(centre_x, centre_y, radius, 0.0, TAU)
     ctx.fill()
 
     if pie.fraction > 0.0:
@@ -84,15 +97,15 @@ def draw(
         Gdk.cairo_set_source_rgba(ctx, rgba)
 
         ctx.arc(
-            width / 2,
-            height / 2,
-            width / 2,
-            -0.5 * pi,
-            (2 * pie.fraction * pi) - (0.5 * pi)
+            centre_x,
+            centre_y,
+            radius,
+            -HALF_PI,
+            pie.fraction * TAU - HALF_PI
         )
 
         if pie.fraction != 1.0:
-            ctx.line_to(width / 2, height / 2)
-            ctx.line_to(width / 2, 0)
+            ctx.line_to(centre_x, centre_y)
+            ctx.line_to(centre_x, 0)
 
         ctx.fill()
@@ -18,43 +18,215 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from gi.repository import GLib
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future
+import traceback
+import time
+import threading
+import os
 from typing import Optional, Any, Callable
 
-def get_tmp_dir() -> Optional[Path]:
+# Worker threads shared by all windows for probing videos and generating their
+# thumbnails. This limits how many ffprobe and thumbnailer processes can run at
+# once when many videos are added together.
+VIDEO_TASK_POOL = ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 2) // 2),
+    thread_name_prefix='constrict-video-task'
+)
+
+
+def submit_video_task(function: Callable, *args: Any) -> Future:
+    """ Run a function on VIDEO_TASK_POOL with the passed arguments, and
+    return its future. If the function raises an exception, its traceback is
+    printed, as nothing else waits on the result.
+    """
+    future = VIDEO_TASK_POOL.submit(function, *args)
+    future.add_done_callback(print_task_exception)
+    return future
+
+
+def print_task_exception(future: Future) -> None:
+    """ Print the traceback of an exception raised by a video task """
+    if future.cancelled():
+        return
+
+    exception = future.exception()
+
+    if exception is not None:
+        traceback.print_exception(exception)
+
+
+# How long files in the cache directory are kept without being used, in
+# seconds.
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Cached results of get_tmp_dir and get_cache_dir, once the directories have
+# been created.
+_tmp_dir: Optional[str] = None
+_cache_dir: Optional[str] = None
+
+# Whether get_cache_dir has already chosen a directory (which may be the temp
+# directory, or None, if the cache directory couldn't be created).
+_cache_dir_chosen = False
+
+
+def get_tmp_dir() -> Optional[str]:
     """ Return the path of system temp directory, to store temporary files like
     ffmpeg log files and video thumbnails. If the temp directory cannot be
     located, None will be returned.
+
+    The directory is only created once per process; later calls return the
+    cached path.
     """
+    global _tmp_dir
+
+    if _tmp_dir is not None:
+        return _tmp_dir
+
     tmp_dir = GLib.get_tmp_dir()
-    constrict_tmp_dir = Path(tmp_dir) / 'constrict'
+    constrict_tmp_dir = os.path.join(tmp_dir, 'constrict')
 
-    mkdir_result = GLib.mkdir_with_parents(str(constrict_tmp_dir), 0o755)
+    mkdir_result = GLib.mkdir_with_parents(constrict_tmp_dir, 0o755)
     successful = mkdir_result == 0
 
     if not successful:
         print('Warning: could not get tmp directory')
+        return None
+
+    _tmp_dir = constrict_tmp_dir
+    return _tmp_dir
+
+
+def get_cache_dir() -> Optional[str]:
+    """ Return the path of the user's cache directory for Constrict, to store
+    files worth keeping between sessions, like video thumbnails and metadata.
+    If it cannot be created, the temp directory from get_tmp_dir is returned
+    instead (or None, if that isn't available either).
+
+    The directory is only chosen (and pruned of stale files) once per
+    process; later calls return the same path, even if it is the fallback.
+    """
+    global _cache_dir, _cache_dir_chosen
+
+    if _cache_dir_chosen:
+        return _cache_dir
+
+    cache_dir = os.path.join(GLib.get_user_cache_dir(), 'constrict')
+
+    mkdir_result = GLib.mkdir_with_parents(cache_dir, 0o755)
+    successful = mkdir_result == 0
+
+    if successful:
+        prune_cache_dir(cache_dir)
+        _cache_dir = cache_dir
+    else:
+        print('Warning: could not get cache directory')
+        _cache_dir = get_tmp_dir()
 
-    return constrict_tmp_dir if successful else None
+    _cache_dir_chosen = True
+    return _cache_dir
 
-def update_ui(function: Callable, arg: Any, daemon: bool) -> None:
+
+def prune_cache_dir(cache_dir: str) -> None:
+    """ Delete files in the passed cache directory that haven't been used in
+    CACHE_MAX_AGE seconds. Cached files are touched whenever they are reused,
+    so only files for videos that haven't been opened in that time are lost.
+    """
+    oldest_allowed = time.time() - CACHE_MAX_AGE
+
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < oldest_allowed:
+                os.remove(entry.path)
+        except OSError:
+            # Another instance may have removed or replaced it already.
+            pass
+
+
+def is_main_thread() -> bool:
+    """ Return whether the caller is running on the main (GTK) thread """
+    return threading.current_thread() is threading.main_thread()
+
+
+def update_ui(function: Callable, *args: Any, daemon: bool = False) -> None:
     """ A helper function to determine whether to run a passed function
     directly, or through GLib.idle_add if running in a separate, daemonic
-    thread (like UI updates while videos are being compressed).
+    thread (like UI updates while videos are being compressed). Any positional
+    arguments after the function are passed on to it.
 
     Without using GLib.idle_add, the UI can freeze when the window is inactive,
     stopping compression progress being shown from the daemon thread. It can
     also cause the UI to glitch out or disappear sometimes. But running
     GLib.idle_add functions from the main thread also seems to cause bugs.
     This just prevented me from writing too much boilerplate code.
+
+    Which of the two is used is decided by the thread the caller is running
+    on, so callers don't need to get the daemon flag right. The flag is only
+    kept so call sites can still document where they expect to run.
     """
-    if daemon:
-        if arg is not None:
-            GLib.idle_add(function, arg)
-        else:
-            GLib.idle_add(function)
+    if is_main_thread():
+        function(*args)
     else:
-        if arg is not None:
-            function(arg)
-        else:
-            function()
+        GLib.idle_add(function, *args)
+
+
+def batch_ui(function: Callable, *args: Any) -> None:
+    """ Like update_ui, but calls made from other threads are added to
+    UI_BATCH, to be applied together with other batched UI updates.
+    """
+    if is_main_thread():
+        function(*args)
+    else:
+        UI_BATCH.add(function, *args)
+
+
+class UIBatch:
+    """ Collects UI updates queued from background threads, so that updates
+    for many widgets are applied together in a single idle callback. If the
+    same method of the same object is queued more than once before then, only
+    the latest arguments are used.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.scheduled = False
+
+    def add(self, function: Callable, *args: Any) -> None:
+        """ Queue a call of function with the passed arguments, to be run on
+        the main thread
+        """
+        # Bound methods of different objects can compare equal, so key each
+        # call by its receiver and name instead of the method itself.
+        key = (getattr(function, '__self__', None), function.__name__)
+
+        with self.lock:
+            self.pending[key] = (function, args)
+
+            if self.scheduled:
+                return
+
+            self.scheduled = True
+
+        GLib.idle_add(self.flush, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def flush(self) -> bool:
+        """ Run every queued call """
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+            self.scheduled = False
+
+        for function, args in pending.values():
+            function(*args)
+
+        return False
+
+
+# Shared by all sources rows, so that rows finishing their background work at
+# the same time have their UI updated in the same main loop iteration.
+UI_BATCH = UIBatch()
@@ -17,7 +17,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from gi.repository import Adw, Gtk, GLib
+from gi.repository import Adw, Gtk
 from constrict.shared import update_ui
 from constrict import PREFIX
 from typing import Any
@@ -37,18 +37,26 @@ class SourcePopoverBox(Gtk.Box):
 
     def set_top_widget(self, widget: Gtk.Widget, daemon: bool) -> None:
         """ Sets the widget to be shown at the top of the popover """
-        update_ui(self.remove, self.top_widget, daemon)
-        update_ui(self.prepend, widget, daemon)
+        update_ui(self.swap_top_widget, self.top_widget, widget, daemon=daemon)
 
         self.top_widget = widget
 
+    def swap_top_widget(
+        self,
+        old_widget: Gtk.Widget,
+        new_widget: Gtk.Widget
+    ) -> None:
+        """ Replace the widget at the top of the popover in one main loop
+        iteration, so the popover is only laid out once for the change
+        """
+        self.remove(old_widget)
+        self.prepend(new_widget)
+
     def add_fail_widget(self, fail_widget: Gtk.Widget, daemon):
         """ Add a widget from when a compression fails to the popover """
-        if daemon:
-            GLib.idle_add(
-                self.insert_child_after,
-                fail_widget,
-                self.top_widget
-            )
-        else:
-            self.add_child_after(fail_widget, self.top_widget)
+        update_ui(
+            self.insert_child_after,
+            fail_widget,
+            self.top_widget,
+            daemon=daemon
+        )
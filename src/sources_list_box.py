@@ -21,7 +21,11 @@ from gi.repository import Adw, Gtk, GLib
 from constrict.shared import update_ui
 from constrict.sources_row import SourcesRow
 from constrict import PREFIX
-from typing import Any, List
+from typing import Any, List, Optional, Iterable
+
+# Row actions enabled or disabled by the list box, in the order of
+# SourcesRow.enabled_actions
+ROW_ACTIONS = ('row.move-up', 'row.move-down', 'row.remove')
 
 
 @Gtk.Template(resource_path=f'{PREFIX}/sources_list_box.ui')
@@ -38,11 +42,22 @@ class SourcesListBox(Gtk.ListBox):
 
     def remove(self, child: Gtk.Widget) -> None:
         """ Remove a child from the list box """
+        index = child.get_index()
         super().remove(child)
-        self.update_rows(False)
+        child.stop_background_work()
+
+        # Only the rows either side of the removed one can have become the
+        # first or last row.
+        if self.get_length() > 1:
+            self.update_rows(False, (index - 1, index))
+        else:
+            self.update_rows(False)
 
     def remove_all(self) -> None:
         """ Remove every child the list box, bar the add videos button """
+        for row in self.get_all():
+            row.stop_background_work()
+
         super().remove_all()
         self.append(self.add_videos_button)
 
@@ -50,6 +65,9 @@ class SourcesListBox(Gtk.ListBox):
         """ Set whether or not the list box and the rows therein are
         interactable
         """
+        if locked == self.locked:
+            return
+
         self.locked = locked
 
         self.update_rows(daemon)
@@ -68,33 +86,35 @@ class SourcesListBox(Gtk.ListBox):
 
     def add_sources(self, video_source_rows: List[SourcesRow]) -> None:
         """ Add a list of SourcesRow rows as children of the list box """
-        dest_index = self.get_length()
+        old_length = self.get_length()
+        dest_index = old_length
 
         for row in video_source_rows:
             self.insert(row, dest_index)
             dest_index += 1
 
-        self.update_rows(False)
+        # Rows that were already in the list only change if the previous last
+        # row can now move down, or if a lone row has become draggable.
+        if old_length > 1:
+            self.update_rows(False, range(old_length - 1, dest_index))
+        else:
+            self.update_rows(False)
 
     def get_all(self) -> List[SourcesRow]:
         """ Get all rows of the list box, bar the 'add videos' button row """
-        length = self.get_length()
-        sources = []
-
-        for i in range(length):
-            row = self.get_row_at_index(i)
-            sources.append(row)
-
-        return sources
+        return [self.get_row_at_index(i) for i in range(self.get_length())]
 
     def move(self, source_row: SourcesRow, dest_row: SourcesRow) -> None:
         """ Move a row to a new destination """
         dest_index = dest_row.get_index()
 
-        self.remove(source_row)
+        super().remove(source_row)
         self.insert(source_row, dest_index)
 
-        self.update_rows(False)
+        # Besides the moved row, only rows entering or leaving the first and
+        # last positions have their available actions changed.
+        last = self.get_length() - 1
+        self.update_rows(False, (0, 1, last - 1, last, dest_index))
 
     def update_row(
         self,
@@ -105,25 +125,38 @@ class SourcesListBox(Gtk.ListBox):
     ) -> None:
         """ Update the interactivity of a row """
         row.set_draggable(length > 1 and not self.locked)
-        update_ui(row.show_drag_handle, not self.locked, daemon)
+        update_ui(row.show_drag_handle, not self.locked, daemon=daemon)
 
-        row.action_set_enabled(
-            'row.move-up',
-            index > 0 and not self.locked
-        )
-        row.action_set_enabled(
-            'row.move-down',
-            index < (length - 1) and not self.locked
-        )
-        row.action_set_enabled(
-            'row.remove',
+        enabled_actions = (
+            index > 0 and not self.locked,
+            index < (length - 1) and not self.locked,
             not self.locked
         )
 
-    def update_rows(self, daemon: bool) -> None:
-        """ Update the interactivity of all rows """
-        rows = self.get_all()
+        # Only touch the actions whose state has changed.
+        for action_name, enabled, was_enabled in zip(
+            ROW_ACTIONS,
+            enabled_actions,
+            row.enabled_actions
+        ):
+            if enabled != was_enabled:
+                row.action_set_enabled(action_name, enabled)
+
+        row.enabled_actions = enabled_actions
+
+    def update_rows(
+        self,
+        daemon: bool,
+        indices: Optional[Iterable[int]] = None
+    ) -> None:
+        """ Update the interactivity of the rows at the given indices, or of all
+        rows if no indices are given. Indices out of range are ignored.
+        """
+        length = self.get_length()
+
+        if indices is None:
+            indices = range(length)
 
-        for i in range(len(rows)):
-            row = rows[i]
-            self.update_row(row, i, len(rows), daemon)
+        for i in sorted(set(indices)):
+            if 0 <= i < length:
+                self.update_row(self.get_row_at_index(i), i, length, daemon)
@@ -26,18 +26,147 @@
 # - https://gitlab.gnome.org/GNOME/gnome-music/-/blob/a79f46a5d81cd48d26c55a6bf10fcd48c16e63ab/gnomemusic/widgets/songwidget.py
 
 from gi.repository import Adw, Gtk, Gio, GLib, Gdk
-from pathlib import Path
-from constrict.shared import get_tmp_dir, update_ui
-from constrict.constrict_utils import get_encode_settings, get_resolution, get_framerate, get_duration
+from constrict.shared import (
+    get_cache_dir,
+    update_ui,
+    batch_ui,
+    submit_video_task
+)
+from constrict.constrict_utils import get_encode_settings, get_video_metadata
 from constrict.enums import SourceState, Thumbnailer
 from constrict.progress_pie import ProgressPie
 from constrict.attempt_fail_box import AttemptFailBox
 from constrict.source_popover_box import SourcePopoverBox
 from constrict import PREFIX
+import functools
+import json
 import threading
 import subprocess
 import os
-from typing import Optional, Any, Callable, Tuple
+from typing import Optional, Any, Callable, Tuple, Dict
+
+BIN_TOTEM = 'totem-video-thumbnailer'
+BIN_FFMPEG = 'ffmpegthumbnailer'
+
+# Size in pixels of generated thumbnails. Rows show them as large (32 px)
+# icons, so this leaves room for screens scaled up to 2x.
+THUMBNAIL_SIZE = 64
+
+# Events for the thumbnails currently being generated, keyed by file hash.
+# Each is set once its thumbnail has been written.
+THUMBNAILS_IN_PROGRESS = {}
+THUMBNAILS_IN_PROGRESS_LOCK = threading.Lock()
+
+# Metadata of every video probed this session, keyed by path, modification
+# time and size, as (width, height, fps, duration).
+VIDEO_METADATA = {}
+
+# Translated once, rather than every time a row's state is refreshed.
+
+# TRANSLATORS: {size} represents a file size value in MB.
+# {unit} represents a file size unit, like 'MB'. Please use U+202F
+# narrow no-break space (' ') between size and unit.
+COMPLETE_TEMPLATE = _('Video compressed to {size} {unit}.')
+
+# TRANSLATORS: {original_size} and {target_size} represent
+# integers. {unit_original} and {unit_target} represent file
+# size units, like 'MB'. Please use U+202F Narrow no-break
+# space (' ') between values and units.
+ALREADY_SMALL_TEMPLATE = _('Video file size ({original_size} {unit_original}) already meets the target size ({target_size} {unit_target}).')
+
+# TRANSLATORS: {size} represents an integer. {unit} represents
+# a file size unit like 'MB'.
+# Please use U+202F Narrow no-break space (' ') between value
+# and unit.
+TARGET_TOO_LOW_TEMPLATE = _('Target size ({size} {unit}) is too low for this file.')
+
+
+def read_cache_record(
+    record_path: str,
+    video_path: str
+) -> Optional[Dict[str, Any]]:
+    """ Return the contents of a cache record written by write_cache_record,
+    or None if there isn't one or it doesn't match the current version of the
+    video at the passed path.
+
+    Cached files are named by the hash of their video's path, which can
+    collide, so each record also stores the path itself to check against.
+    """
+    try:
+        with open(record_path) as record_file:
+            record = json.load(record_file)
+
+        video_stat = os.stat(video_path)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        is_current = (
+            record['path'] == video_path
+            and record['size'] == video_stat.st_size
+            and record['mtime'] == video_stat.st_mtime
+        )
+    except (KeyError, TypeError):
+        return None
+
+    if not is_current:
+        return None
+
+    # Mark the record as used, so it isn't pruned from the cache.
+    try:
+        os.utime(record_path)
+    except OSError:
+        pass
+
+    return record
+
+
+def write_cache_record(
+    record_path: str,
+    video_path: str,
+    fields: Dict[str, Any]
+) -> None:
+    """ Write a cache record with the passed fields for the video at the
+    passed path, along with the video's path, size and modification time
+    """
+    partial_path = f'{record_path}.{threading.get_ident()}.part'
+
+    try:
+        video_stat = os.stat(video_path)
+
+        with open(partial_path, 'w') as record_file:
+            json.dump({
+                'path': video_path,
+                'size': video_stat.st_size,
+                'mtime': video_stat.st_mtime,
+                **fields
+            }, record_file)
+
+        # Replace in one step, so readers never see a partial file.
+        os.replace(partial_path, record_path)
+    except OSError:
+        print(f'Warning: could not write cache record {record_path}')
+
+
+@functools.cache
+def find_thumbnailer() -> Tuple[Optional[int], Optional[str]]:
+    """ Return which thumbnailer to use and its path. The Totem thumbnailer is
+    preferred, with the FFMPEG thumbnailer as a fallback. If neither is
+    installed, (None, None) is returned.
+
+    The result is cached, as it won't change while the app is running.
+    """
+    totem_path = GLib.find_program_in_path(BIN_TOTEM)
+
+    if totem_path:
+        return Thumbnailer.TOTEM, totem_path
+
+    ffmpeg_path = GLib.find_program_in_path(BIN_FFMPEG)
+
+    if ffmpeg_path:
+        return Thumbnailer.FFMPEG, ffmpeg_path
+
+    return None, None
 
 
 @Gtk.Template(resource_path=f'{PREFIX}/sources_row.ui')
@@ -62,6 +191,10 @@ class SourcesRow(Adw.ActionRow):
     popover = Gtk.Template.Child()
     popover_scrolled_window = Gtk.Template.Child()
 
+    # Widgets shown under the cursor while a row is dragged, shared by all rows
+    drag_preview_box: Optional[Gtk.ListBox] = None
+    drag_preview_row: Optional['SourcesRow'] = None
+
     def __init__(
         self,
         video_path: str,
@@ -83,6 +216,9 @@ class SourcesRow(Adw.ActionRow):
         self.width = None
         self.fps = None
         self.duration = None
+        self.src_label = None
+        self.file_hash = file_hash
+        self.metadata_lock = threading.Lock()
         self.state = SourceState.PENDING
         self.error_details = ""
         self.error_action = error_action
@@ -93,6 +229,9 @@ class SourcesRow(Adw.ActionRow):
 
         self.set_title(display_name)
 
+        # Read on the main thread, as the preview is built on a worker thread.
+        self.is_rtl = self.get_direction() == Gtk.TextDirection.RTL
+
         self.install_action('row.move-up', None, self.move_up)
         self.install_action('row.move-down', None, self.move_down)
         self.install_action('row.on-error', None, self.on_error_query)
@@ -103,25 +242,63 @@ class SourcesRow(Adw.ActionRow):
         )
         self.install_action('row.remove', None, self.on_remove)
 
+        # Whether the move up, move down and remove actions are enabled, as
+        # last set by the list box. Installed actions start enabled.
+        self.enabled_actions = (True, True, True)
+
+        self.drag_widget = None
+
+        self.popover_box = None
+
+        # Set once the row is removed from its list, to stop background work.
+        self.removed = threading.Event()
+
+        # The thumbnail is only generated once the row is first shown, so
+        # rows that never are don't run a thumbnailer.
+        self.thumbnail_future = None
+
         if file_hash:
-            thumb_thread = threading.Thread(
-                target=self.set_thumbnail,
-                args=[file_hash, True]
-            )
-            thumb_thread.daemon = True
-            thumb_thread.start()
+            self.connect('map', self.request_thumbnail)
+            self.connect('unmap', self.cancel_thumbnail)
 
+        # Queued last, as the task can start before __init__ returns.
         if target_size_getter and fps_mode_getter:
-            preview_thread = threading.Thread(
-                target=self.set_preview,
-                args=[target_size_getter, fps_mode_getter, True]
+            submit_video_task(
+                self.set_preview,
+                target_size_getter,
+                fps_mode_getter,
+                True
             )
-            preview_thread.daemon = True
-            preview_thread.start()
 
-        self.drag_widget = None
+    def request_thumbnail(self, row: Gtk.Widget) -> None:
+        """ Start generating the row's thumbnail in the background, unless it
+        already has been
+        """
+        future = self.thumbnail_future
 
-        self.popover_box = None
+        if future is not None and not future.cancelled():
+            return
+
+        self.thumbnail_future = submit_video_task(
+            self.set_thumbnail,
+            self.file_hash,
+            True
+        )
+
+    def stop_background_work(self) -> None:
+        """ Stop or skip any preview and thumbnail work for the row, once it has
+        been removed from its list
+        """
+        self.removed.set()
+        self.cancel_thumbnail(self)
+
+    def cancel_thumbnail(self, row: Gtk.Widget) -> None:
+        """ Drop the row's thumbnail from the queue if it hasn't started being
+        generated yet, e.g. if the row is removed while waiting its turn. It
+        will be requested again if the row is shown again.
+        """
+        if self.thumbnail_future is not None:
+            self.thumbnail_future.cancel()
 
     def initiate_popover_box(
         self,
@@ -133,7 +310,7 @@ class SourcesRow(Adw.ActionRow):
         update_ui(
             self.popover_scrolled_window.set_child,
             self.popover_box,
-            daemon
+            daemon=daemon
         )
 
     def set_popover_top_widget(
@@ -201,10 +378,30 @@ class SourcesRow(Adw.ActionRow):
     ) -> None:
         """ Show a drag widget attached to the user's cursor when they begin to
         drag the row """
-        self.drag_widget = Gtk.ListBox.new()
+        # The same drag widget is reused for every drag, rather than building
+        # a new list box and row each time.
+        if SourcesRow.drag_preview_row is None:
+            SourcesRow.drag_preview_row = SourcesRow(
+                self.video_path,
+                self.display_name
+            )
+            SourcesRow.drag_preview_box = Gtk.ListBox.new()
+            SourcesRow.drag_preview_box.append(SourcesRow.drag_preview_row)
+            SourcesRow.drag_preview_box.drag_highlight_row(
+                SourcesRow.drag_preview_row
+            )
+
+        drag_row = SourcesRow.drag_preview_row
+        self.drag_widget = SourcesRow.drag_preview_box
+
+        # Take the widget back if the icon of a previous drag still holds it.
+        previous_icon = self.drag_widget.get_parent()
+        if previous_icon:
+            previous_icon.set_child(None)
+
         self.drag_widget.set_size_request(self.get_width(), -1)
 
-        drag_row = SourcesRow(self.video_path, self.display_name)
+        drag_row.set_title(self.display_name)
         drag_row.set_subtitle(self.get_subtitle())
         drag_row.set_state(self.state, False)
 
@@ -215,9 +412,8 @@ class SourcesRow(Adw.ActionRow):
         elif thumb_storage_type == Gtk.ImageType.PAINTABLE:
             paintable = self.thumbnail.get_paintable()
             drag_row.thumbnail.set_from_paintable(paintable)
-
-        self.drag_widget.append(drag_row)
-        self.drag_widget.drag_highlight_row(drag_row)
+        else:
+            drag_row.thumbnail.clear()
 
         drag_icon = Gtk.DragIcon.get_for_drag(drag)
         drag_icon.set_child(self.drag_widget)
@@ -233,7 +429,7 @@ class SourcesRow(Adw.ActionRow):
         this_list_box = self.get_parent()
 
         # Don't allow drop if source and target are not in the same list box.
-        return Gdk.DragAction.MOVE if this_list_box == source_list_box else 0
+        return Gdk.DragAction.MOVE if this_list_box is source_list_box else 0
 
     @Gtk.Template.Callback()
     def on_drop(
@@ -260,7 +456,7 @@ class SourcesRow(Adw.ActionRow):
 
         # Only allow re-arranging rows in the same window. I.e., do not allow
         # dragging of sources to the list box of another Constrict window.
-        if this_list_box != source_list_box:
+        if this_list_box is not source_list_box:
             return False
 
         this_list_box.move(source_row, self)
@@ -286,12 +482,112 @@ class SourcesRow(Adw.ActionRow):
         """ Run the function responsible for displaying error details """
         row.error_action(row.display_name, row.error_details)
 
+    def load_metadata(self) -> None:
+        """ Fetch the resolution, framerate and duration of the video
+        represented by the row with a single probe, and cache them within the
+        object. Only one thread probes the video; others wait for its result.
+        """
+        with self.metadata_lock:
+            if self.duration is not None:
+                return
+
+            # Rows for the same, unchanged file share one entry in memory.
+            try:
+                video_stat = os.stat(self.video_path)
+                key = (
+                    self.video_path,
+                    video_stat.st_mtime_ns,
+                    video_stat.st_size
+                )
+            except OSError:
+                key = None
+
+            metadata = VIDEO_METADATA.get(key) if key else None
+
+            if metadata is None:
+                metadata = self.read_cached_metadata()
+
+            if metadata is None:
+                metadata = get_video_metadata(self.video_path)
+                self.write_cached_metadata(metadata)
+
+            if key:
+                VIDEO_METADATA[key] = metadata
+
+            width, height, fps, duration = metadata
+
+            self.width, self.height = width, height
+            self.fps = fps
+            self.duration = duration
+
+    def get_metadata_cache_path(self) -> Optional[str]:
+        """ Return the path of the file caching the video's metadata between
+        sessions, or None if it can't be cached
+        """
+        if not self.file_hash:
+            return None
+
+        cache_dir = get_cache_dir()
+
+        if not cache_dir:
+            return None
+
+        return os.path.join(cache_dir, f'{self.file_hash}.json')
+
+    def read_cached_metadata(
+        self
+    ) -> Optional[Tuple[int, int, float, float]]:
+        """ Return the video's width, height, framerate and duration from the
+        metadata cache, or None if they aren't cached or the video has
+        changed since.
+        """
+        cache_path = self.get_metadata_cache_path()
+
+        if not cache_path:
+            return None
+
+        cached = read_cache_record(cache_path, self.video_path)
+
+        if cached is None:
+            return None
+
+        try:
+            return (
+                int(cached['width']),
+                int(cached['height']),
+                float(cached['fps']),
+                float(cached['duration'])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def write_cached_metadata(
+        self,
+        metadata: Tuple[int, int, float, float]
+    ) -> None:
+        """ Store the video's width, height, framerate and duration in the
+        metadata cache, so later sessions don't need to probe it again
+        """
+        cache_path = self.get_metadata_cache_path()
+
+        if not cache_path:
+            return
+
+        width, height, fps, duration = metadata
+
+        write_cache_record(cache_path, self.video_path, {
+            'width': width,
+            'height': height,
+            'fps': fps,
+            'duration': duration
+        })
+
     def get_resolution(self) -> Tuple[int, int]:
         """ Get the resolution of the video represented by the row. This
         resolution is cached within the object after first fetching it.
         """
-        if not self.width or not self.height:
-            self.width, self.height = get_resolution(self.video_path)
+        if self.width is None or self.height is None:
+            self.load_metadata()
 
         return (self.width, self.height)
 
@@ -299,8 +595,8 @@ class SourcesRow(Adw.ActionRow):
         """ Get the framerate of the video represented by the row. This
         framerate is cached within the object after first fetching it.
         """
-        if not self.fps:
-            self.fps = get_framerate(self.video_path)
+        if self.fps is None:
+            self.load_metadata()
 
         return self.fps
 
@@ -308,83 +604,184 @@ class SourcesRow(Adw.ActionRow):
         """ Get the duration of the video represented by the row. This
         duration is cached within the object after first fetching it.
         """
-        if not self.duration:
-            self.duration = get_duration(self.video_path)
+        if self.duration is None:
+            self.load_metadata()
 
         return self.duration
 
     def set_thumbnail(self, file_hash: int, daemon: bool) -> None:
         """ Set a thumbnail for the row, by running a thumbnailer on the video
         this row represents, and storing it named with the video's file hash
-        in a temp directory
+        in the cache directory
         """
-        bin_totem = 'totem-video-thumbnailer'
-        bin_ffmpeg = 'ffmpegthumbnailer'
+        if self.removed.is_set():
+            return
 
-        # Check Totem thumbnailer is installed.
-        # Use FFMPEG thumbnailer as a fallback.
-        # Use video-x-generic icon as the fallback's fallback.
+        # Check cache directory is available to write.
+        cache_dir = get_cache_dir()
 
-        totem_exists = GLib.find_program_in_path(bin_totem)
-        thumbnailer = Thumbnailer.TOTEM
+        if not cache_dir:
+            batch_ui(self.thumbnail.set_from_icon_name, 'video-x-generic')
+            return
 
-        if not totem_exists:
-            ffmpeg_exists = GLib.find_program_in_path(bin_ffmpeg)
-            thumbnailer = Thumbnailer.FFMPEG
+        thumb_file = os.path.join(cache_dir, f'{file_hash}.jpg')
 
-            if not ffmpeg_exists:
-                update_ui(
-                    self.thumbnail.set_from_icon_name,
-                    'video-x-generic',
-                    daemon
-                )
+        while True:
+            # Reuse a thumbnail made earlier for this video (e.g. by a previous
+            # session or window), as long as the video hasn't changed since.
+            if self.is_thumbnail_current(thumb_file):
+                self.show_thumbnail(thumb_file, daemon)
                 return
 
-        # Check tmp directory is available to write.
-        tmp_dir = get_tmp_dir()
+            # If another row is already generating this thumbnail (e.g. the
+            # same video was added twice), wait for it instead of running a
+            # second thumbnailer on the same file.
+            with THUMBNAILS_IN_PROGRESS_LOCK:
+                in_progress = THUMBNAILS_IN_PROGRESS.get(file_hash)
 
-        if not tmp_dir:
-            update_ui(
-                self.thumbnail.set_from_icon_name,
-                'video-x-generic',
-                daemon
-            )
-            return
+                if in_progress is None:
+                    THUMBNAILS_IN_PROGRESS[file_hash] = threading.Event()
+
+            if in_progress is None:
+                break
+
+            # Check again once it's done. If that row was removed and its
+            # thumbnailer stopped, this row generates the thumbnail itself.
+            in_progress.wait()
+
+            if self.removed.is_set():
+                return
 
-        thumb_file = str(tmp_dir / f'{file_hash}.jpg')
+        try:
+            self.generate_thumbnail(thumb_file, daemon)
+        finally:
+            with THUMBNAILS_IN_PROGRESS_LOCK:
+                THUMBNAILS_IN_PROGRESS.pop(file_hash).set()
+
+    def is_thumbnail_current(self, thumb_file: str) -> bool:
+        """ Return whether the thumbnail at the passed path exists and was made
+        from the current version of the video this row represents
+        """
+        try:
+            if os.path.getsize(thumb_file) == 0:
+                return False
+        except OSError:
+            return False
+
+        record = read_cache_record(f'{thumb_file}.json', self.video_path)
+
+        if record is None:
+            return False
+
+        # Mark the thumbnail as used, so it isn't pruned from the cache.
+        try:
+            os.utime(thumb_file)
+        except OSError:
+            pass
+
+        return True
+
+    def generate_thumbnail(self, thumb_file: str, daemon: bool) -> None:
+        """ Run a thumbnailer on the video this row represents, saving the
+        thumbnail to the passed path, and show it in the row
+        """
+        thumbnailer, thumbnailer_path = find_thumbnailer()
+
+        if thumbnailer is None:
+            batch_ui(self.thumbnail.set_from_icon_name, 'video-x-generic')
+            return
 
         if thumbnailer == Thumbnailer.TOTEM:
-            subprocess.run([
-                bin_totem,
+            thumbnailer_cmd = [
+                thumbnailer_path,
+                '-s',
+                str(THUMBNAIL_SIZE),
                 self.video_path,
                 thumb_file
-            ])
+            ]
         elif thumbnailer == Thumbnailer.FFMPEG:
-            subprocess.run([
-                bin_ffmpeg,
+            thumbnailer_cmd = [
+                thumbnailer_path,
+                '-s',
+                str(THUMBNAIL_SIZE),
                 '-i',
                 self.video_path,
                 '-o',
                 thumb_file
-            ])
+            ]
         else:
             raise Exception('Unknown thumbnailer set. Whoopsie daisies.')
 
-        update_ui(self.thumbnail.set_from_file, thumb_file, daemon)
+        if self.removed.is_set():
+            return
+
+        # The thumbnailer's output isn't needed, so don't set up pipes for it.
+        thumbnailer_process = subprocess.Popen(
+            thumbnailer_cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        # Stop the thumbnailer early if the row is removed meanwhile.
+        while True:
+            try:
+                thumbnailer_process.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if not self.removed.is_set():
+                    continue
+
+                thumbnailer_process.terminate()
+                thumbnailer_process.wait()
+
+                # Don't leave a partly written thumbnail to be reused later.
+                try:
+                    os.remove(thumb_file)
+                except OSError:
+                    pass
+
+                return
+
+        # Record which video the thumbnail was made from, so it's only reused
+        # for that exact file.
+        if thumbnailer_process.returncode == 0:
+            write_cache_record(f'{thumb_file}.json', self.video_path, {})
+
+        self.show_thumbnail(thumb_file, daemon)
+
+    def show_thumbnail(self, thumb_file: str, daemon: bool) -> None:
+        """ Show the thumbnail image at the passed path in the row. The image
+        is decoded on the calling thread, so only the finished texture is
+        handed to the main loop.
+        """
+        if self.removed.is_set():
+            return
+
+        try:
+            texture = Gdk.Texture.new_from_filename(thumb_file)
+        except GLib.Error:
+            batch_ui(self.thumbnail.set_from_icon_name, 'video-x-generic')
+            return
+
+        batch_ui(self.thumbnail.set_from_paintable, texture)
 
     def get_size(self) -> int:
         """ Get the file size of the input video this row represents """
-        if self.size:
-            return self.size
+        if self.size is None:
+            self.size = os.path.getsize(self.video_path)
 
-        self.size = os.stat(self.video_path).st_size
         return self.size
 
     def set_incompatible(self, incompatible_msg: str, daemon: bool) -> None:
         """ Show a message indicating there's a problem with the set target
         size in relation to the video
         """
-        update_ui(self.incompatible_label.set_label, incompatible_msg, daemon)
+        update_ui(
+            self.incompatible_label.set_label,
+            incompatible_msg,
+            daemon=daemon
+        )
         self.set_state(SourceState.INCOMPATIBLE, daemon)
 
     def set_error(self, error_details: str, daemon: bool) -> None:
@@ -402,14 +799,11 @@ class SourcesRow(Adw.ActionRow):
         """ Put the row in complete state, after compression has finished """
         update_ui(
             self.complete_label.set_label,
-            # TRANSLATORS: {size} represents a file size value in MB.
-            # {unit} represents a file size unit, like 'MB'. Please use U+202F
-            # narrow no-break space (' ') between size and unit.
-            _('Video compressed to {size} {unit}.').format(
+            COMPLETE_TEMPLATE.format(
                 size = compressed_size_mb,
                 unit = 'MiB'
             ),
-            daemon
+            daemon=daemon
         )
         self.compressed_path = compressed_video_path
         self.set_state(SourceState.COMPLETE, daemon)
@@ -424,20 +818,18 @@ class SourcesRow(Adw.ActionRow):
         information """
         if self.state == SourceState.BROKEN:
             return
-        elif self.get_size() < target_size * 1024 * 1024:
-            size_mb = round(self.get_size() / 1024 / 1024, 1)
+
+        size = self.get_size()
+
+        if size < target_size * 1024 * 1024:
+            size_mb = round(size / 1024 / 1024, 1)
             self.set_incompatible(
-                # TRANSLATORS: {original_size} and {target_size} represent
-                # integers. {unit_original} and {unit_target} represent file
-                # size units, like 'MB'. Please use U+202F Narrow no-break
-                # space (' ') between values and units.
-                _('Video file size ({original_size} {unit_original}) already meets the target size ({target_size} {unit_target}).')
-                    .format(
-                        original_size = size_mb,
-                        unit_original = 'MiB',
-                        target_size = target_size,
-                        unit_target = 'MiB'
-                    ),
+                ALREADY_SMALL_TEMPLATE.format(
+                    original_size = size_mb,
+                    unit_original = 'MiB',
+                    target_size = target_size,
+                    unit_target = 'MiB'
+                ),
                 daemon
             )
         # Why is this threshold much higher than the one in constrict_utils.py?
@@ -447,12 +839,10 @@ class SourcesRow(Adw.ActionRow):
         # increased threshold is a courtesy to prevent wasting the user's time.
         elif video_bitrate < 11000:
             self.set_incompatible(
-                # TRANSLATORS: {size} represents an integer. {unit} represents
-                # a file size unit like 'MB'.
-                # Please use U+202F Narrow no-break space (' ') between value
-                # and unit.
-                _('Target size ({size} {unit}) is too low for this file.')
-                    .format(size = target_size, unit = 'MiB'),
+                TARGET_TOO_LOW_TEMPLATE.format(
+                    size = target_size,
+                    unit = 'MiB'
+                ),
                 daemon
             )
         else:
@@ -468,7 +858,7 @@ class SourcesRow(Adw.ActionRow):
         resolution/framerate is and an estimation of the compressed video's
         resolution/framerate.
         """
-        if self.state == SourceState.BROKEN:
+        if self.state == SourceState.BROKEN or self.removed.is_set():
             return
 
         try:
@@ -496,19 +886,22 @@ class SourcesRow(Adw.ActionRow):
         self.refresh_state(video_bitrate, target_size, daemon)
 
         if self.state == SourceState.INCOMPATIBLE:
-            update_ui(self.set_subtitle, '', daemon)
+            batch_ui(self.set_subtitle, '')
             return
 
-        src_pixels = self.height if self.height < self.width else self.width
+        # The source video doesn't change, so its label is only built once.
+        if self.src_label is None:
+            src_pixels = min(width, height)
+            self.src_label = f'{src_pixels}p@{round(fps)}'
 
-        src_label = f'{src_pixels}p@{int(round(self.fps, 0))}'
-        dest_label = f'{target_pixels}p@{int(round(target_fps, 0))}'
+        src_label = self.src_label
+        dest_label = f'{target_pixels}p@{round(target_fps)}'
 
         subtitle = f'{dest_label} ← {src_label}' if (
-            self.get_direction() == Gtk.TextDirection.RTL
+            self.is_rtl
         ) else f'{src_label} → {dest_label}'
 
-        update_ui(self.set_subtitle, subtitle, daemon)
+        batch_ui(self.set_subtitle, subtitle)
 
     def set_state(self, state: int, daemon: bool) -> None:
         """ Set the row's state, and change the UI to reflect it """
@@ -525,15 +918,11 @@ class SourcesRow(Adw.ActionRow):
         if (is_broken or is_incompatible) and self.warning_action:
             self.warning_action(True, daemon)
 
-        update_ui(self.progress_button.set_visible, is_compressing, daemon)
-        update_ui(self.complete_button.set_visible, is_complete, daemon)
-        update_ui(self.error_icon.set_visible, is_error, daemon)
-        update_ui(self.video_broken_button.set_visible, is_broken, daemon)
-        update_ui(
-            self.incompatible_button.set_visible,
-            is_incompatible,
-            daemon
-        )
+        batch_ui(self.progress_button.set_visible, is_compressing)
+        batch_ui(self.complete_button.set_visible, is_complete)
+        batch_ui(self.error_icon.set_visible, is_error)
+        batch_ui(self.video_broken_button.set_visible, is_broken)
+        batch_ui(self.incompatible_button.set_visible, is_incompatible)
 
         self.state = state
 
@@ -541,8 +930,12 @@ class SourcesRow(Adw.ActionRow):
         """ Change whether to show a spinner or a progress pie for the
         row's progression widget.
         """
-        update_ui(self.progress_pie.set_visible, not enable_spinner, daemon)
-        update_ui(self.progress_spinner.set_visible, enable_spinner, daemon)
+        batch_ui(self.progress_pie.set_visible, not enable_spinner)
+        batch_ui(self.progress_spinner.set_visible, enable_spinner)
+
+    def set_progress_fraction(self, fraction: float, daemon: bool) -> None:
+        """ Set the progress shown by the row's progress pie """
+        update_ui(self.progress_pie.set_fraction, fraction, daemon=daemon)
 
     def show_drag_handle(self, shown: bool) -> None:
         """ Show or hide the row's drag handle icon """
@@ -562,6 +955,20 @@ class SourcesRow(Adw.ActionRow):
         file_launcher = Gtk.FileLauncher.new(compressed_file)
         file_launcher.open_containing_folder()
 
+    def move_by(self, delta: int) -> None:
+        """ Move the row by the passed number of positions in its parent list
+        box, in a single move. Negative numbers move it up. The row stops at
+        the top or bottom of the list.
+        """
+        list_box = self.get_parent()
+        index = self.get_index()
+        dest_index = min(max(index + delta, 0), list_box.get_length() - 1)
+
+        if dest_index == index:
+            return
+
+        list_box.move(self, list_box.get_row_at_index(dest_index))
+
     def move_up(
         self,
         row: 'SourcesRow',
@@ -569,14 +976,7 @@ class SourcesRow(Adw.ActionRow):
         parameter: GLib.Variant
     ) -> None:
         """ Move the row up in its parent list box """
-        list_box = row.get_parent()
-        prev_index = row.get_index() - 1
-        prev_row = list_box.get_row_at_index(prev_index)
-
-        if not prev_row:
-            return
-
-        list_box.move(row, prev_row)
+        row.move_by(-1)
 
     def move_down(
         self,
@@ -585,14 +985,7 @@ class SourcesRow(Adw.ActionRow):
         parameter: GLib.Variant
     ) -> None:
         """ Move the row down in its parent list box """
-        list_box = row.get_parent()
-        next_index = row.get_index() + 1
-        next_row = list_box.get_row_at_index(next_index)
-
-        if not next_row or next_row == list_box.add_videos_button:
-            return
-
-        list_box.move(row, next_row)
+        row.move_by(1)
 
 
 
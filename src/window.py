@@ -19,16 +19,18 @@
 
 from gi.repository import Adw, Gtk, Gdk, Gio, GLib, GObject
 from constrict.constrict_utils import compress
-from constrict.shared import get_tmp_dir, update_ui
+from constrict.shared import (
+    get_tmp_dir,
+    update_ui,
+    batch_ui
+)
 from constrict.enums import FpsMode, VideoCodec, SourceState
 from constrict.sources_row import SourcesRow
 from constrict.sources_list_box import SourcesListBox
-from constrict.error_dialog import ErrorDialog
 from constrict.current_attempt_box import CurrentAttemptBox
 from constrict import PREFIX
 import threading
 import subprocess
-from pathlib import Path
 import os
 from typing import Any, List
 
@@ -217,19 +219,35 @@ class ConstrictWindow(Adw.ApplicationWindow):
     def set_controls_lock(self, is_locked: bool, daemon: bool) -> None:
         """ Set whether to make most of the window's controls like compression
         settings and source video management interactable or not """
-        update_ui(self.target_size_row.set_sensitive, not is_locked, daemon)
-        update_ui(self.auto_row.set_sensitive, not is_locked, daemon)
-        update_ui(self.clear_row.set_sensitive, not is_locked, daemon)
-        update_ui(self.smooth_row.set_sensitive, not is_locked, daemon)
-        update_ui(self.codec_dropdown.set_sensitive, not is_locked, daemon)
+        update_ui(
+            self.target_size_row.set_sensitive,
+            not is_locked,
+            daemon=daemon
+        )
+        update_ui(self.auto_row.set_sensitive, not is_locked, daemon=daemon)
+        update_ui(self.clear_row.set_sensitive, not is_locked, daemon=daemon)
+        update_ui(self.smooth_row.set_sensitive, not is_locked, daemon=daemon)
+        update_ui(
+            self.codec_dropdown.set_sensitive,
+            not is_locked,
+            daemon=daemon
+        )
         update_ui(
             self.extra_quality_toggle.set_sensitive,
             not is_locked,
-            daemon
+            daemon=daemon
+        )
+        update_ui(
+            self.tolerance_row.set_sensitive,
+            not is_locked,
+            daemon=daemon
         )
-        update_ui(self.tolerance_row.set_sensitive, not is_locked, daemon)
 
-        update_ui(self.clear_all_action.set_enabled, not is_locked, daemon)
+        update_ui(
+            self.clear_all_action.set_enabled,
+            not is_locked,
+            daemon=daemon
+        )
         self.clear_all_action.set_enabled(not is_locked)
         self.open_action.set_enabled(not is_locked)
         self.export_action.set_enabled(not is_locked)
@@ -244,8 +262,8 @@ class ConstrictWindow(Adw.ApplicationWindow):
         """ Set whether to put the window in a warning state, disabling export
         and showing a banner communicating this.
         """
-        update_ui(self.export_action.set_enabled, not is_error, daemon)
-        update_ui(self.warning_banner.set_revealed, is_error, daemon)
+        update_ui(self.export_action.set_enabled, not is_error, daemon=daemon)
+        update_ui(self.warning_banner.set_revealed, is_error, daemon=daemon)
 
     def refresh_can_export(self, daemon: bool) -> None:
         """ Set whether the export action is enabled or not based on the states
@@ -254,12 +272,12 @@ class ConstrictWindow(Adw.ApplicationWindow):
         sources = self.sources_list_box.get_all()
 
         if not sources:
-            update_ui(self.export_action.set_enabled, False, daemon)
-            update_ui(self.warning_banner.set_revealed, False, daemon)
+            update_ui(self.export_action.set_enabled, False, daemon=daemon)
+            update_ui(self.warning_banner.set_revealed, False, daemon=daemon)
             update_ui(
                 self.view_stack.set_visible_child_name,
                 'status_page',
-                daemon
+                daemon=daemon
             )
             return
 
@@ -275,7 +293,7 @@ class ConstrictWindow(Adw.ApplicationWindow):
         self.set_warning_state(False, daemon)
 
         if complete_count == len(sources):
-            update_ui(self.export_action.set_enabled, False, daemon)
+            update_ui(self.export_action.set_enabled, False, daemon=daemon)
 
     def set_compressing_title(self, current_index: int, export_dir: str):
         """ Set the text in the window's title bar when compression is taking
@@ -327,8 +345,8 @@ class ConstrictWindow(Adw.ApplicationWindow):
             # TRANSLATORS: {} represents the number of files queued.
             self.set_title(_('{} Videos Queued').format(vid_count))
 
-        update_ui(self.window_title.set_title, self.get_title(), daemon)
-        update_ui(self.window_title.set_subtitle, '', daemon)
+        update_ui(self.window_title.set_title, self.get_title(), daemon=daemon)
+        update_ui(self.window_title.set_subtitle, '', daemon=daemon)
 
     def refresh_previews(self, widget: Gtk.Widget, *args: Any) -> None:
         """ Refresh the previews of all source rows in the sources list box.
@@ -343,6 +361,11 @@ class ConstrictWindow(Adw.ApplicationWindow):
         sources = self.sources_list_box.get_all()
 
         for video in sources:
+            # Rows still probing their video would block the main thread.
+            # Their queued preview reads the current settings once it runs.
+            if video.duration is None:
+                continue
+
             video.set_preview(self.get_target_size, self.get_fps_mode, False)
 
         self.refresh_can_export(False)
@@ -412,8 +435,12 @@ class ConstrictWindow(Adw.ApplicationWindow):
         """ Change whether to show the 'cancel' button or the 'export' button
         in the window
         """
-        update_ui(self.cancel_bar.set_visible, is_compressing, daemon)
-        update_ui(self.export_bar.set_visible, not is_compressing, daemon)
+        update_ui(self.cancel_bar.set_visible, is_compressing, daemon=daemon)
+        update_ui(
+            self.export_bar.set_visible,
+            not is_compressing,
+            daemon=daemon
+        )
 
     def export_file_dialog(self, action: Gio.Action, parameter: GLib.Variant) -> None:
         """ Show a file chooser for the folder to export videos to """
@@ -491,6 +518,9 @@ class ConstrictWindow(Adw.ApplicationWindow):
 
     def error_dialog(self, file_name: str, error_details: str) -> None:
         """ Show an error dialog for a video's compression error """
+        # Imported here, as most sessions never show an error dialog.
+        from constrict.error_dialog import ErrorDialog
+
         dialog = ErrorDialog(file_name, error_details)
 
         dialog.present(self)
@@ -575,6 +605,19 @@ class ConstrictWindow(Adw.ApplicationWindow):
 
         return final_path
 
+    def show_progress(
+        self,
+        video: SourcesRow,
+        progress_box: CurrentAttemptBox,
+        fraction: float,
+        seconds_left: int
+    ) -> None:
+        """ Show a video's compression progress in both its row and its
+        progress box
+        """
+        progress_box.set_progress(fraction, seconds_left, False)
+        video.set_progress_fraction(fraction, False)
+
     def bulk_compress(self, destination_dir: str, daemon: bool) -> None:
         """ Compress all videos in the sources list box, exporting to the
         passed destination directory
@@ -629,8 +672,15 @@ class ConstrictWindow(Adw.ApplicationWindow):
                     progress_box.pulse_progress(daemon)
                 else:
                     video.enable_spinner(False, daemon)
-                    progress_box.set_progress(fraction, seconds_left, daemon)
-                    update_ui(video.progress_pie.set_fraction, fraction, daemon)
+
+                    # Update the row and its progress box in one callback.
+                    batch_ui(
+                        self.show_progress,
+                        video,
+                        progress_box,
+                        fraction,
+                        seconds_left
+                    )
 
             def set_attempt_details(
                 attempt,
@@ -673,9 +723,7 @@ class ConstrictWindow(Adw.ApplicationWindow):
             tmp_dir = get_tmp_dir()
             log_filename = f'constrict2pass-{self.get_id()}'
 
-            log_path = str(tmp_dir / log_filename) if (
-                tmp_dir
-            ) else str(Path(destination_dir) / log_filename)
+            log_path = os.path.join(tmp_dir or destination_dir, log_filename)
 
             input_basename = os.path.basename(video.video_path)
             merged = os.path.join(destination_dir, input_basename)
@@ -727,7 +775,7 @@ class ConstrictWindow(Adw.ApplicationWindow):
 
                 toast.connect('button-clicked', self.show_error_from_toast)
 
-                update_ui(self.toast_overlay.add_toast, toast, daemon)
+                update_ui(self.toast_overlay.add_toast, toast, daemon=daemon)
 
                 trash_video()
 
@@ -758,10 +806,10 @@ class ConstrictWindow(Adw.ApplicationWindow):
         if not self.compressing:
             toast = Adw.Toast.new(_('Compression Canceled'))
             toast.set_priority(Adw.ToastPriority.HIGH)
-            update_ui(self.toast_overlay.add_toast, toast, daemon)
+            update_ui(self.toast_overlay.add_toast, toast, daemon=daemon)
         else:
             toast = Adw.Toast.new(_('Compression Complete'))
-            update_ui(self.toast_overlay.add_toast, toast, daemon)
+            update_ui(self.toast_overlay.add_toast, toast, daemon=daemon)
 
             self.send_complete_notification(source_list, destination_dir)
 